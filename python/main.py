@@ -1,13 +1,14 @@
 """Training and prediction of a CNN (Convolutional Neural Network)."""
 import sys
 
+import numpy as np
+
 from ml.factory import factory as ml_factory
 from ml.act_func.types import ActFuncType
 from ml.cnn.cnn import Cnn
 from ml.cnn.interface import ICnn
-from ml.types import Matrix3d
+from ml.types import DTYPE, Matrix3d
 
-# pylint: disable=consider-using-enumerate
 
 def _use_real_impl() -> bool:
     """Check whether real implementations are to be used."""
@@ -25,21 +26,14 @@ def predict_and_print(cnn: ICnn, inputs: Matrix3d) -> None:
     # Terminate function if no input sets are available.
     if len(inputs) == 0:
         return
-    last = len(inputs) - 1
-    print("--------------------------------------------------------------------------------")
-
-    # Perform prediction with each input set, print the predicted output in the terminal.
-    for i in range(len(inputs)):
-        print("Input:", end=" ")
-        print(inputs[i])
-
-        print("Prediction:", end=" ")
-        print(cnn.predict(inputs[i]))
+    separator = "--------------------------------------------------------------------------------"
+    predict = cnn.predict
 
-        # Add a blank line before the next print.
-        if i != last:
-            print()
-    print("--------------------------------------------------------------------------------\n")
+    # Perform prediction with each input set, print the predicted outputs in the terminal
+    # with a single write (the input sets are separated by a blank line).
+    parts = [f"Input: {input_data.tolist()}\nPrediction: {predict(input_data).tolist()}\n"
+             for input_data in inputs]
+    sys.stdout.write(f"{separator}\n" + "\n".join(parts) + f"{separator}\n\n")
 
 
 def main() -> None:
@@ -59,7 +53,7 @@ def main() -> None:
     learning_rate = 0.01
 
     # Input data for training (digits 0 - 1).
-    inputs = [
+    inputs = np.array([
         [[1, 1, 1, 1],
          [1, 0, 0, 1],
          [1, 0, 0, 1],
@@ -67,9 +61,9 @@ def main() -> None:
         [[0, 1, 0, 0],
          [0, 1, 0, 0],
          [0, 1, 0, 0],
-         [0, 1, 0, 0]]]
+         [0, 1, 0, 0]]], dtype=DTYPE)
     # Output data for training (the corresponding numbers).
-    outputs = [[0], [1]]
+    outputs = np.array([[0], [1]], dtype=DTYPE)
 
     # Create a machine learning factory.
     factory = ml_factory.create(use_stubs)
@@ -0,0 +1,44 @@
+"""Common base of the layer implementations."""
+from ml.types import Matrix1d, Matrix2d
+
+class _LayerBase:
+    """Common base of the layer implementations."""
+
+    # The output and input gradient buffers of the layer, the layer sizes are derived from
+    # the lengths of these buffers unless a layer overrides the size getters.
+    __slots__ = ("_input_gradients", "_output")
+
+    _input_gradients: Matrix1d | Matrix2d
+    _output: Matrix1d | Matrix2d
+
+    def input_size(self) -> int:
+        """Get the input size of the layer.
+
+        Returns:
+            The input size of the layer.
+        """
+        return len(self._input_gradients)
+
+    def output_size(self) -> int:
+        """Get the output size of the layer.
+
+        Returns:
+            The output size of the layer.
+        """
+        return len(self._output)
+
+    def output(self) -> Matrix1d | Matrix2d:
+        """Get the output of the layer.
+
+        Returns:
+            Matrix holding the output of the layer.
+        """
+        return self._output
+
+    def input_gradients(self) -> Matrix1d | Matrix2d:
+        """Get the input gradients of the layer.
+
+        Returns:
+            Matrix holding the input gradients of the layer.
+        """
+        return self._input_gradients
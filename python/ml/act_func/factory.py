@@ -5,6 +5,14 @@ from ml.act_func.tanh import Tanh
 from ml.act_func.identity import Identity
 from ml.act_func.interface import IActFunc
 
+# Activation function instances for each activation function type. The activation functions
+# are stateless, hence one shared instance per type is used by all layers.
+_ACT_FUNCS = {
+    ActFuncType.RELU:     Relu(),
+    ActFuncType.TANH:     Tanh(),
+    ActFuncType.IDENTITY: Identity(),
+}
+
 def create(act_func_type: ActFuncType) -> IActFunc:
     """Create an activation function.
 
@@ -12,12 +20,9 @@ def create(act_func_type: ActFuncType) -> IActFunc:
         act_func_type: The type of activation function to create.
 
     Returns:
-        The new activation function.
+        The activation function (shared between all callers, since it's stateless).
     """
-    if act_func_type == ActFuncType.RELU:
-        return Relu()
-    if act_func_type == ActFuncType.TANH:
-        return Tanh()
-    if act_func_type == ActFuncType.IDENTITY:
-        return Identity()
-    raise ValueError(f"Invalid activation function {act_func_type}")
+    try:
+        return _ACT_FUNCS[act_func_type]
+    except KeyError:
+        raise ValueError(f"Invalid activation function {act_func_type}") from None
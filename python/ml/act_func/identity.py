@@ -1,24 +1,31 @@
 """Identity activation function implementation (no activation applied)."""
+import numpy as np
+
 from ml.act_func.interface import IActFunc
 
 class Identity(IActFunc):
     """Identity activation function implementation (no activation applied)."""
 
-    def output(self, value: float) -> float:
+    def output(self, value: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
         """Compute the activation function output.
 
         Args:
             value: The activation function input.
+            out: Matrix to store the output in (default = new matrix). May be the input
+                 itself to apply the activation function in place.
         Returns:
-            The activation function value at the given input.
+            The activation function values at the given input (the input itself).
         """
-        return value
+        if out is None or out is value:
+            return value
+        np.copyto(out, value)
+        return out
 
-    def delta(self, value: float) -> float:
+    def delta(self, output: np.ndarray) -> np.ndarray:
         """Compute the activation function derivative (delta for backpropagation).
         Args:
-            value: The activation function input.
+            output: The activation function output.
         Returns:
-            The derivative value at the given input.
+            The derivative values at the given output.
         """
-        return 1.0
+        return np.ones_like(output)
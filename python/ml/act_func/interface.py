@@ -2,24 +2,31 @@
 
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 class IActFunc(ABC):
     """Activation function interface."""
 
     @abstractmethod
-    def output(self, value: float) -> float:
+    def output(self, value: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
         """Compute the activation function output.
 
         Args:
             value: The activation function input.
+            out: Matrix to store the output in (default = new matrix). May be the input
+                 itself to apply the activation function in place.
         Returns:
-            The activation function value at the given input.
+            The activation function values at the given input.
         """
 
     @abstractmethod
-    def delta(self, value: float) -> float:
+    def delta(self, output: np.ndarray) -> np.ndarray:
         """Compute the activation function derivative (delta for backpropagation).
+
+           The derivative is expressed in terms of the activation function output, i.e. the
+           values previously returned by the output method, so no activation is recomputed.
         Args:
-            value: The activation function input.
+            output: The activation function output.
         Returns:
-            The derivative value at the given input.
+            The derivative values at the given output.
         """
@@ -1,24 +1,30 @@
 """ReLU (Rectified Linear Unit) activation function implementation."""
+import numpy as np
+
 from ml.act_func.interface import IActFunc
 
 class Relu(IActFunc):
     """ReLU (Rectified Linear Unit) activation function implementation."""
 
-    def output(self, value: float) -> float:
+    def output(self, value: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
         """Compute the activation function output.
 
         Args:
             value: The activation function input.
+            out: Matrix to store the output in (default = new matrix). May be the input
+                 itself to apply the activation function in place.
         Returns:
-            The activation function value at the given input.
+            The activation function values at the given input.
         """
-        return value if 0.0 < value  else 0.0
+        return np.maximum(value, 0.0, out=out)
 
-    def delta(self, value: float) -> float:
+    def delta(self, output: np.ndarray) -> np.ndarray:
         """Compute the activation function derivative (delta for backpropagation).
         Args:
-            value: The activation function input.
+            output: The activation function output.
         Returns:
-            The derivative value at the given input.
+            The derivative values at the given output.
         """
-        return 1.0 if 0.0 < value else 0.0
+        # The output is never negative, so its sign is 1 for active and 0 for inactive nodes.
+        # A single ufunc avoids the intermediate boolean mask of a comparison.
+        return np.sign(output)
@@ -1,50 +1,28 @@
 """Tanh (hyperbolic tangent) activation function implementation."""
-import math
+import numpy as np
 
 from ml.act_func.interface import IActFunc
 
 class Tanh(IActFunc):
     """Tanh (hyperbolic tangent) activation function implementation."""
 
-    def output(self, value: float) -> float:
+    def output(self, value: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
         """Compute the activation function output.
 
         Args:
             value: The activation function input.
+            out: Matrix to store the output in (default = new matrix). May be the input
+                 itself to apply the activation function in place.
         Returns:
-            The activation function value at the given input.
+            The activation function values at the given input.
         """
-        return math.tanh(value)
+        return np.tanh(value, out=out)
 
-    def delta(self, value: float) -> float:
+    def delta(self, output: np.ndarray) -> np.ndarray:
         """Compute the activation function derivative (delta for backpropagation).
         Args:
-            value: The activation function input.
-        Returns:
-            The derivative value at the given input.
-        """
-        tanh_output = math.tanh(value)
-        return 1.0 - tanh_output * tanh_output
-
-
-class Identity(IActFunc):
-    """Identity activation function implementation (no activation applied)."""
-
-    def output(self, value: float) -> float:
-        """Compute the activation function output.
-
-        Args:
-            value: The activation function input.
-        Returns:
-            The activation function value at the given input.
-        """
-        return value
-
-    def delta(self, value: float) -> float:
-        """Compute the activation function derivative (delta for backpropagation).
-        Args:
-            value: The activation function input.
+            output: The activation function output.
         Returns:
-            The derivative value at the given input.
+            The derivative values at the given output.
         """
-        return 1.0
+        return 1.0 - output * output
@@ -1,38 +1,32 @@
 """Convolutional neural network (CNN) implementation."""
-import random
+import numpy as np
 
 from ml import utils
 from ml.act_func.types import ActFuncType
 from ml.cnn.interface import ICnn
 from ml.factory.interface import IFactory
-from ml.types import Matrix1d, Matrix2d, Matrix3d
+from ml.types import DTYPE, Matrix1d, Matrix2d, Matrix3d
 
-# pylint: disable=too-many-arguments
+# pylint: disable=too-many-arguments, too-many-instance-attributes
 
 class _TrainOrderList:
     """Training order list implementation."""
 
     def __init__(self, size) -> None:
-        self._data = [0] * size
-        for i in range(size):
-            self._data[i] = i
+        self._data = np.arange(size, dtype=np.int32)
+        self._rng  = np.random.default_rng()
 
-    def data(self) -> tuple[int]:
+    def data(self) -> np.ndarray:
         """Get the train order list.
         
         Returns:
-            The train order list as a tuple.
+            The train order list as an array of indexes.
         """
         return self._data
 
     def shuffle(self) -> None:
-        """Shuffle the training order list."""
-        size = len(self._data)
-        for i in range(size):
-            r = random.randint(0, size - 1)
-            temp = self._data[i]
-            self._data[i] = self._data[r]
-            self._data[r] = temp
+        """Shuffle the training order list (in place)."""
+        self._rng.shuffle(self._data)
 
 
 class Cnn(ICnn):
@@ -46,16 +40,21 @@ class Cnn(ICnn):
         self._factory       = factory
 
         # Add convolutional layers.
-        self._conv_layers.append(factory.conv_layer(conv_input, conv_kernel, conv_func))
+        conv_layer = factory.conv_layer(conv_input, conv_kernel, conv_func)
+        self._conv_layers.append(conv_layer)
+        self._conv_layers.append(factory.max_pool(conv_layer.output_size(), pool_size))
 
-        self._conv_layers.append(factory.max_pool(self._conv_output_size(), pool_size))
+        # Cache adjacent layer pairs and the last layer for the hot paths.
+        self._conv_pairs = list(zip(self._conv_layers, self._conv_layers[1:]))
+        self._last_conv  = self._conv_layers[-1]
 
         # Add a flatten layer.
-        self._flatten_layer = factory.flatten_layer(self._conv_output_size())
+        self._flatten_layer = factory.flatten_layer(self._last_conv.output_size())
 
         # Add a dense layer.
         dense_input = self._flatten_layer.output_size()
         self._dense_layers.append(factory.dense_layer(dense_input, dense_output, dense_func))
+        self._update_dense_layers()
 
     def input_size(self) -> int:
         """Get the input size of the CNN.
@@ -71,12 +70,7 @@ class Cnn(ICnn):
         Returns:
             The output size of the CNN.
         """
-        last = len(self._dense_layers) - 1
-        return self._dense_layers[last].output_size()
-
-    def _output(self) -> Matrix1d:
-        last = len(self._dense_layers) - 1
-        return self._dense_layers[last].output()
+        return self._last_dense.output_size()
 
     def predict(self, input_data: Matrix2d) -> Matrix1d:
         """Predict based on the given input.
@@ -88,7 +82,7 @@ class Cnn(ICnn):
             The predicted output.
         """
         self._feedforward(input_data)
-        return self._output()
+        return self._last_dense.output()
 
     def add_dense_layer(self, output_size: int, act_func_type: ActFuncType) -> None:
         """Add dense layer.
@@ -101,6 +95,7 @@ class Cnn(ICnn):
         """
         self._dense_layers.append(
             self._factory.dense_layer(self.output_size(), output_size, act_func_type))
+        self._update_dense_layers()
 
     def train(self, train_in: Matrix3d, train_out: Matrix2d, epoch_count: int,
               learning_rate: float) -> bool:
@@ -124,86 +119,83 @@ class Cnn(ICnn):
         set_count = min(len(train_in), len(train_out))
         if not utils.check_train_set_count(set_count, op):
             return False
+        # Stack the training sets into contiguous arrays once, the epoch loop only indexes them.
+        train_in  = np.ascontiguousarray(train_in[:set_count], dtype=DTYPE)
+        train_out = np.ascontiguousarray(train_out[:set_count], dtype=DTYPE)
         # Create a training order list.
         train_order = _TrainOrderList(set_count)
+        # Bind the training steps once, since they are invoked for every training set.
+        feedforward   = self._feedforward
+        backpropagate = self._backpropagate
+        optimize      = self._optimize
         # Train the network the specified number of epochs.
         for _ in range(epoch_count):
             # Shuffle the training order list at the start of each epoch.
             train_order.shuffle()
-            # Iterate through the training sets, return false on failure.
-            for i in train_order.data():
-                input_data  = train_in[i]
-                output = train_out[i]
-                success = (self._feedforward(input_data) and self._backpropagate(output)
-                           and self._optimize(learning_rate))
+            # Iterate through the training sets, return false on failure. The indexes are
+            # converted to Python integers, which index the training sets much faster than
+            # NumPy integer scalars.
+            for i in train_order.data().tolist():
+                success = (feedforward(train_in[i]) and backpropagate(train_out[i])
+                           and optimize(learning_rate))
                 if not success:
                     return False
         # Return true on success.
         return True
 
-    def _conv_output_size(self) -> int:
-        last = len(self._conv_layers) - 1
-        return self._conv_layers[last].output_size()
-
-    def _conv_output(self) -> Matrix2d:
-        last = len(self._conv_layers) - 1
-        return self._conv_layers[last].output()
+    def _update_dense_layers(self) -> None:
+        # Refresh the cached dense layer references after the dense layers have changed.
+        self._dense_pairs = list(zip(self._dense_layers, self._dense_layers[1:]))
+        self._last_dense  = self._dense_layers[-1]
 
     def _feedforward(self, input_data) -> bool:
         # Run feedforward operation in the convolutional layers, return false on failure.
-        success = self._conv_layers[0].feedforward(input_data)
-        for i in range(1, len(self._conv_layers)):
-            prev_layer = self._conv_layers[i - 1]
-            success &= self._conv_layers[i].feedforward(prev_layer.output())
-        if not success:
+        if not self._conv_layers[0].feedforward(input_data):
             return False
+        for prev_layer, layer in self._conv_pairs:
+            if not layer.feedforward(prev_layer.output()):
+                return False
         # Flatten the output from the convolutional layers, return false on failure.
-        success = self._flatten_layer.feedforward(self._conv_output())
-        if not success:
+        if not self._flatten_layer.feedforward(self._last_conv.output()):
+            return False
+        # Run feedforward operation in the dense layers, return false on failure.
+        if not self._dense_layers[0].feedforward(self._flatten_layer.output()):
             return False
-        # Run feedforward operation in the dense layers.
-        success = self._dense_layers[0].feedforward(self._flatten_layer.output())
-        for i in range(1, len(self._dense_layers)):
-            prev_layer = self._dense_layers[i - 1]
-            success &= self._dense_layers[i].feedforward(prev_layer.output())
+        for prev_layer, layer in self._dense_pairs:
+            if not layer.feedforward(prev_layer.output()):
+                return False
         # Return true on success.
-        return success
+        return True
 
     def _backpropagate(self, output: Matrix1d) -> bool:
         # Backpropagate through the dense layers, return false on failure.
-        last = len(self._dense_layers) - 1
-        success = self._dense_layers[last].backpropagate(output)
-        for i in range(last, 0, -1):
-            input_gradients = self._dense_layers[i].input_gradients()
-            success &= self._dense_layers[i - 1].backpropagate(input_gradients)
-        if not success:
+        if not self._last_dense.backpropagate(output):
             return False
+        for prev_layer, layer in reversed(self._dense_pairs):
+            if not prev_layer.backpropagate(layer.input_gradients()):
+                return False
         # Unflatten the input gradients from the first dense layer, return false on failure.
-        input_gradients = self._dense_layers[0].input_gradients()
-        success = self._flatten_layer.backpropagate(input_gradients)
-        if not success:
+        if not self._flatten_layer.backpropagate(self._dense_layers[0].input_gradients()):
+            return False
+        # Backpropagate through the convolutional layers, return false on failure.
+        if not self._last_conv.backpropagate(self._flatten_layer.input_gradients()):
             return False
-        # Backpropagate through the convolutional layers.
-        last = len(self._conv_layers) - 1
-        input_gradients = self._flatten_layer.input_gradients()
-        success = self._conv_layers[last].backpropagate(input_gradients)
-        for i in range(last, 0, -1):
-            input_gradients = self._conv_layers[i].input_gradients()
-            success &= self._conv_layers[i - 1].backpropagate(input_gradients)
+        for prev_layer, layer in reversed(self._conv_pairs):
+            if not prev_layer.backpropagate(layer.input_gradients()):
+                return False
         # Return true on success.
-        return success
+        return True
 
     def _optimize(self, learning_rate: float) -> bool:
         # Optimize the convolutional layers, return false on failure.
-        success = self._conv_layers[0].optimize(learning_rate)
-        for i in range(1, len(self._conv_layers)):
-            success &= self._conv_layers[i].optimize(learning_rate)
-        if not success:
-            return False
+        for layer in self._conv_layers:
+            if not layer.optimize(learning_rate):
+                return False
         # Optimize the dense layers, return false on failure.
-        success = self._dense_layers[0].optimize(self._flatten_layer.output(), learning_rate)
-        for i in range(1, len(self._dense_layers)):
-            prev_layer = self._dense_layers[i - 1]
-            success &= self._dense_layers[i].optimize(prev_layer.output(), learning_rate)
+        if not self._dense_layers[0].optimize(self._flatten_layer.output(), learning_rate):
+            return False
+        for prev_layer, layer in self._dense_pairs:
+            if not layer.optimize(prev_layer.output(), learning_rate):
+                return False
         # Return true on success.
-        return success
+        return True
@@ -1,2 +1,2 @@
 """Package initialization."""
-from . import conv, interface, max_pool, stub
+from . import conv, interface, max_pool, stub, types, utils
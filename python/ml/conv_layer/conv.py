@@ -1,6 +1,121 @@
 """Convolutional layer implementation."""
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
-# Todo: Implement the ml.conv_layer.Conv class here.
+from ml import utils
+from ml._layer_base import _LayerBase
+from ml.act_func import factory as act_func_factory
+from ml.act_func.types import ActFuncType
+from ml.conv_layer import utils as conv_utils
+from ml.conv_layer.interface import IConvLayer
+from ml.types import DTYPE, Matrix2d
 
-# When you have implemented this class, update the factory (ml/factory/factory.py)
-# to use it instead of the stub.
+# pylint: disable=too-many-instance-attributes
+
+class Conv(_LayerBase, IConvLayer):
+    """Convolutional layer implementation."""
+
+    def __init__(self, input_size: int, kernel_size: int,
+                 act_func_type: ActFuncType = ActFuncType.IDENTITY) -> None:
+        # Throw if the kernel size is outside range [1, 11] or larger than the input size.
+        conv_utils.check_kernel_size(input_size, kernel_size)
+
+        # Initialize the member variables.
+        padded_size           = input_size + kernel_size - 1
+        self._offset          = (kernel_size - 1) // 2
+        self._input_padded    = utils.create_matrix2d(padded_size)
+        self._input_gradients = utils.create_matrix2d(input_size)
+        self._output          = utils.create_matrix2d(input_size)
+        self._error           = utils.create_matrix2d(input_size)
+        self._act_func        = act_func_factory.create(act_func_type)
+
+        # The error is padded on all sides, so that the input gradients can be computed as a
+        # correlation with the flipped kernel.
+        self._error_padded = utils.create_matrix2d(input_size + 2 * (kernel_size - 1))
+
+        # Create the kernel windows over the padded buffers once, they are views and hence
+        # always reflect the current buffer contents. The windows overlap, so unfolding them
+        # into columns (im2col) requires a copy, which is stored in preallocated buffers.
+        window_shape        = (kernel_size, kernel_size)
+        columns_shape       = (input_size * input_size, kernel_size * kernel_size)
+        grad_end            = self._offset + padded_size
+        self._input_windows = sliding_window_view(self._input_padded, window_shape)
+        self._error_windows = sliding_window_view(
+            self._error_padded[self._offset:grad_end, self._offset:grad_end], window_shape)
+        self._input_columns = np.zeros(columns_shape, dtype=DTYPE)
+        self._error_columns = np.zeros(columns_shape, dtype=DTYPE)
+
+        # Randomize the trainable parameters. The kernel and the bias are views into a single
+        # parameter buffer, so that optimization updates all of them in one operation.
+        kernel_len       = kernel_size * kernel_size
+        self._params     = np.random.default_rng().random(kernel_len + 1, dtype=DTYPE)
+        self._gradients  = np.zeros_like(self._params)
+        self._kernel     = self._params[:kernel_len].reshape(window_shape)
+        self._bias       = self._params[kernel_len:]
+
+    def feedforward(self, input_data: Matrix2d) -> bool:
+        """Perform feedforward operation.
+
+        Args:
+            input_data: Matrix holding input data.
+
+        Returns:
+            True on success, false on failure.
+        """
+        op = "feedforward in convolutional layer"
+        if not (utils.match_dimensions(self.input_size(), len(input_data), op)
+                and utils.is_matrix2d_square(input_data, op)):
+            return False
+        # Copy the input into the padded input, then unfold the kernel windows into columns
+        # (im2col), so that the convolution becomes a single matrix-vector product.
+        start, end = self._offset, self._offset + self.input_size()
+        self._input_padded[start:end, start:end] = input_data
+        np.copyto(self._input_columns.reshape(self._input_windows.shape), self._input_windows)
+        np.matmul(self._input_columns, self._kernel.reshape(-1), out=self._output.reshape(-1))
+        self._output += self._bias
+        self._act_func.output(self._output, out=self._output)
+        return True
+
+    def backpropagate(self, output_gradients: Matrix2d) -> bool:
+        """Perform backpropagation.
+
+        Args:
+            output_gradients: Matrix holding gradients from the next layer.
+
+        Returns:
+            True on success, false on failure.
+        """
+        op = "backpropagation in convolutional layer"
+        if not (utils.match_dimensions(self.output_size(), len(output_gradients), op)
+                and utils.is_matrix2d_square(output_gradients, op)):
+            return False
+        np.multiply(output_gradients, self._act_func.delta(self._output), out=self._error)
+        # Distribute the error over the inputs each kernel position was applied to
+        # (correlation of the padded error with the flipped kernel).
+        start, end = self._kernel.shape[0] - 1, self._kernel.shape[0] - 1 + self.output_size()
+        self._error_padded[start:end, start:end] = self._error
+        np.copyto(self._error_columns.reshape(self._error_windows.shape), self._error_windows)
+        # The flipped kernel is the kernel part of the parameter buffer in reverse order.
+        np.matmul(self._error_columns, self._params[self._kernel.size - 1::-1],
+                  out=self._input_gradients.reshape(-1))
+        return True
+
+    def optimize(self, learning_rate: float) -> bool:
+        """
+        Perform optimization.
+
+        Args:
+            learning_rate: Learning rate to use. Must be in range (0.0, 1.0].
+
+        Returns:
+            True on success, false on failure.
+        """
+        op = "optimization in convolutional layer"
+        if not utils.check_learning_rate(learning_rate, op):
+            return False
+        # The kernel gradients are the input columns weighted by the error of each output,
+        # the bias gradient is the total error.
+        np.matmul(self._input_columns.T, self._error.reshape(-1), out=self._gradients[:-1])
+        self._gradients[-1] = self._error.sum()
+        self._params += learning_rate * self._gradients
+        return True
@@ -1,6 +1,90 @@
 """Max pooling layer implementation."""
+import numpy as np
 
-# Todo: Implement the ml.conv_layer.MaxPool class here.
+from ml import utils
+from ml._layer_base import _LayerBase
+from ml.conv_layer import utils as conv_utils
+from ml.conv_layer.interface import IConvLayer
+from ml.types import DTYPE, Matrix2d
 
-# When you have implemented this class, update the factory (ml/factory/factory.py)
-# to use it instead of the stub.
+# pylint: disable=unused-argument
+
+class MaxPool(_LayerBase, IConvLayer):
+    """Max pooling layer implementation."""
+
+    def __init__(self, input_size: int, pool_size: int) -> None:
+        # Check the pool dimensions, throw if invalid.
+        conv_utils.check_pool_size(input_size, pool_size)
+
+        # Initialize the pool matrices.
+        output_size           = input_size // pool_size
+        window_count          = output_size * output_size
+        window_len            = pool_size * pool_size
+        self._input_gradients = utils.create_matrix2d(input_size)
+        self._output          = utils.create_matrix2d(output_size)
+
+        # Position in the input of each value of each (non-overlapping) pool window, and a
+        # buffer holding the values of each pool window contiguously.
+        self._input_positions = np.arange(input_size * input_size).reshape(
+            output_size, pool_size, output_size, pool_size).swapaxes(1, 2).reshape(
+            window_count, window_len)
+        self._window_values   = np.zeros((window_count, window_len), dtype=DTYPE)
+
+        # Start of each pool window in the window buffer, and the position of the max value
+        # of each pool window in the window buffer.
+        self._window_starts = np.arange(window_count) * window_len
+        self._max_positions = np.zeros(window_count, dtype=np.intp)
+
+    def feedforward(self, input_data: Matrix2d) -> bool:
+        """Perform feedforward operation.
+
+        Args:
+            input_data: Matrix holding input data.
+
+        Returns:
+            True on success, false on failure.
+        """
+        op = "feedforward in max pooling layer"
+        if not (utils.match_dimensions(self.input_size(), len(input_data), op)
+                and utils.is_matrix2d_square(input_data, op)):
+            return False
+        # Gather the values of each pool window, then reduce each window to its max value.
+        # Store the position of the max value, so that backpropagation doesn't need to scan
+        # the windows again.
+        np.take(np.asarray(input_data, dtype=DTYPE).reshape(-1), self._input_positions,
+                out=self._window_values)
+        self._window_values.argmax(axis=-1, out=self._max_positions)
+        self._max_positions += self._window_starts
+        self._window_values.take(self._max_positions, out=self._output.reshape(-1))
+        return True
+
+    def backpropagate(self, output_gradients: Matrix2d) -> bool:
+        """Perform backpropagation.
+
+        Args:
+            output_gradients: Matrix holding gradients from the next layer.
+
+        Returns:
+            True on success, false on failure.
+        """
+        op = "backpropagation in max pooling layer"
+        if not (utils.match_dimensions(self.output_size(), len(output_gradients), op)
+                and utils.is_matrix2d_square(output_gradients, op)):
+            return False
+        # Route each gradient to the input that held the max value of its pool window.
+        utils.init_matrix2d(self._input_gradients)
+        np.put(self._input_gradients, self._input_positions.take(self._max_positions),
+               output_gradients)
+        return True
+
+    def optimize(self, learning_rate: float) -> bool:
+        """
+        Perform optimization.
+
+        Args:
+            learning_rate: Learning rate to use. Must be in range (0.0, 1.0].
+
+        Returns:
+            True (optimization is a no-op for pooling layers).
+        """
+        return True
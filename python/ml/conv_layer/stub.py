@@ -1,30 +1,21 @@
 """Convolutional layer stub."""
-from enum import IntEnum
 from ml import utils
+from ml._layer_base import _LayerBase
 from ml.act_func import factory as act_func_factory
 from ml.act_func.types import ActFuncType
+from ml.conv_layer import utils as conv_utils
 from ml.conv_layer.interface import IConvLayer
 from ml.types import Matrix2d
 
-class KernelSize(IntEnum):
-    """Enumeration of kernel size limits."""
-    MIN = 1  # Minimum permitted kernel size.
-    MAX = 11 # Maximum permitted kernel size.
-
 # pylint: disable=unused-argument
 
-class ConvStub(IConvLayer):
+class ConvStub(_LayerBase, IConvLayer):
     """Convolutional layer stub."""
 
     def __init__(self, input_size: int, kernel_size: int,
                  act_func_type: ActFuncType = ActFuncType.IDENTITY) -> None:
         # Throw if the kernel size is outside range [1, 11] or larger than the input size.
-        if kernel_size < KernelSize.MIN.value or kernel_size > KernelSize.MAX.value:
-            raise ValueError(f"Invalid kernel size {kernel_size}: kernel size must be in range"
-                             f"[{KernelSize.MIN.value}, {KernelSize.MAX.value}]!")
-        if input_size < kernel_size:
-            raise ValueError("Failed to create convolutional layer: "
-                             "kernel size cannot be greater than input size!")
+        conv_utils.check_kernel_size(input_size, kernel_size)
 
         # Initialize the member variables.
         self._input_gradients = utils.create_matrix2d(input_size)
@@ -32,38 +23,6 @@ class ConvStub(IConvLayer):
         self._output          = utils.create_matrix2d(input_size)
         self._act_func        = act_func_factory.create(act_func_type)
 
-    def input_size(self) -> int:
-        """Get the input size of the layer.
-        
-        Returns: 
-            The input size of the layer.
-        """
-        return len(self._input_gradients)
-
-    def output_size(self) -> int:
-        """Get the output size of the layer.
-        
-        Returns: 
-            The output size of the layer.
-        """
-        return len(self._output)
-
-    def output(self) -> Matrix2d:
-        """Get the output of the layer.
-        
-        Returns: 
-            Matrix holding the output of the layer.
-        """
-        return self._output
-
-    def input_gradients(self) -> Matrix2d:
-        """Get the input gradients of the layer.
-        
-        Returns: 
-            Matrix holding the input gradients of the layer.
-        """
-        return self._input_gradients
-
     def feedforward(self, input_data: Matrix2d) -> bool:
         """Perform feedforward operation.
         
@@ -104,20 +63,12 @@ class ConvStub(IConvLayer):
         op = "optimization in convolutional layer"
         return utils.check_learning_rate(learning_rate, op)
 
-class MaxPoolStub(IConvLayer):
+class MaxPoolStub(_LayerBase, IConvLayer):
     """Max pooling layer stub."""
 
     def __init__(self, input_size: int, pool_size: int) -> None:
         # Check the pool dimensions, throw if invalid.
-        if input_size == 0:
-            raise ValueError("Input size cannot be 0!")
-        if pool_size == 0:
-            raise ValueError("Pool size cannot be 0!")
-        if input_size < pool_size:
-            raise ValueError("Input size cannot be smaller than the pool size!")
-        if input_size % pool_size != 0:
-            raise ValueError("Input size must be divisible by pool size!:" \
-            f"input_size = {input_size}, pool_size = {pool_size}")
+        conv_utils.check_pool_size(input_size, pool_size)
 
         # Initialize the pool matrices.
         output_size           = input_size // pool_size
@@ -125,38 +76,6 @@ class MaxPoolStub(IConvLayer):
         self._input_gradients = utils.create_matrix2d(input_size)
         self._output          = utils.create_matrix2d(output_size)
 
-    def input_size(self) -> int:
-        """Get the input size of the layer.
-        
-        Returns: 
-            The input size of the layer.
-        """
-        return len(self._input)
-
-    def output_size(self) -> int:
-        """Get the output size of the layer.
-        
-        Returns: 
-            The output size of the layer.
-        """
-        return len(self._output)
-
-    def output(self) -> Matrix2d:
-        """Get the output of the layer.
-        
-        Returns: 
-            Matrix holding the output of the layer.
-        """
-        return self._output
-
-    def input_gradients(self) -> Matrix2d:
-        """Get the input gradients of the layer.
-        
-        Returns: 
-            Matrix holding the input gradients of the layer.
-        """
-        return self._input_gradients
-
     def feedforward(self, input_data: Matrix2d) -> bool:
         """Perform feedforward operation.
         
@@ -0,0 +1,7 @@
+"""Convolutional layer types."""
+from enum import IntEnum
+
+class KernelSize(IntEnum):
+    """Enumeration of kernel size limits."""
+    MIN = 1  # Minimum permitted kernel size.
+    MAX = 11 # Maximum permitted kernel size.
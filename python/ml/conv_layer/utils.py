@@ -0,0 +1,34 @@
+"""Convolutional layer utility functions."""
+from ml.conv_layer.types import KernelSize
+
+def check_kernel_size(input_size: int, kernel_size: int) -> None:
+    """Check the kernel size of a convolutional layer. Throw an exception if invalid.
+
+    Args:
+        input_size: Input size of the layer.
+        kernel_size: Kernel size. Must be in range [1, 11] and not greater than the input size.
+    """
+    # Throw if the kernel size is outside range [1, 11] or larger than the input size.
+    if kernel_size < KernelSize.MIN.value or kernel_size > KernelSize.MAX.value:
+        raise ValueError(f"Invalid kernel size {kernel_size}: kernel size must be in range"
+                         f"[{KernelSize.MIN.value}, {KernelSize.MAX.value}]!")
+    if input_size < kernel_size:
+        raise ValueError("Failed to create convolutional layer: "
+                         "kernel size cannot be greater than input size!")
+
+def check_pool_size(input_size: int, pool_size: int) -> None:
+    """Check the pool size of a max pooling layer. Throw an exception if invalid.
+
+    Args:
+        input_size: Input size of the layer. Must be divisible by the pool size.
+        pool_size: Pool size. Must be greater than 0 and not greater than the input size.
+    """
+    if input_size == 0:
+        raise ValueError("Input size cannot be 0!")
+    if pool_size == 0:
+        raise ValueError("Pool size cannot be 0!")
+    if input_size < pool_size:
+        raise ValueError("Input size cannot be smaller than the pool size!")
+    if input_size % pool_size != 0:
+        raise ValueError("Input size must be divisible by pool size!:" \
+        f"input_size = {input_size}, pool_size = {pool_size}")
@@ -1,13 +1,16 @@
 """Dense layer implementation."""
-import random
+import numpy as np
 
 from ml import utils
+from ml._layer_base import _LayerBase
 from ml.act_func import factory as act_func_factory
 from ml.act_func.types import ActFuncType
 from ml.dense_layer.interface import IDenseLayer
-from ml.types import Matrix1d
+from ml.types import DTYPE, Matrix1d
 
-class Dense(IDenseLayer):
+# pylint: disable=too-many-instance-attributes
+
+class Dense(_LayerBase, IDenseLayer):
     """Dense layer implementation."""
 
     def __init__(self, input_size: int, output_size: int,
@@ -19,19 +22,29 @@ class Dense(IDenseLayer):
             raise ValueError("Weight count cannot be 0!")
 
         # Initialize member variables.
+        self._input_size      = input_size
+        self._output_size     = output_size
         self._input_gradients = utils.create_matrix1d(input_size)
         self._output          = utils.create_matrix1d(output_size)
         self._error           = utils.create_matrix1d(output_size)
-        self._bias            = utils.create_matrix1d(output_size)
-        self._weights         = utils.create_matrix2d(output_size, input_size)
         self._act_func        = act_func_factory.create(act_func_type)
 
-        # Randomize the trainable parameters.
-        rand = random.Random()
-        for i in range(output_size):
-            self._bias[i] = rand.random()
-            for j in range(input_size):
-                self._weights[i][j] = rand.random()
+        # The weights and the bias are views into a single parameter buffer, where the bias is
+        # the last column. The input is extended with a constant 1 for the bias column, so that
+        # feedforward and optimization handle all parameters in one operation.
+        self._params         = utils.create_matrix2d(output_size, input_size + 1)
+        self._gradients      = np.zeros_like(self._params)
+        self._weights        = self._params[:, :input_size]
+        self._bias           = self._params[:, input_size]
+        self._input_extended = utils.create_matrix1d(input_size + 1)
+        self._input_extended[input_size] = 1.0
+
+        # Randomize the weights around zero, scaled by the input size, so that the weighted sums
+        # don't saturate the activation function. The bias starts at zero.
+        limit = 1.0 / np.sqrt(input_size)
+        self._weights[:] = np.random.default_rng().random((output_size, input_size), dtype=DTYPE)
+        self._weights *= 2.0 * limit
+        self._weights -= limit
 
     def input_size(self) -> int:
         """Get the input size of the layer.
@@ -39,7 +52,7 @@ class Dense(IDenseLayer):
         Returns: 
             The input size of the layer.
         """
-        return len(self._input_gradients)
+        return self._input_size
 
     def output_size(self) -> int:
         """Get the output size of the layer.
@@ -47,23 +60,7 @@ class Dense(IDenseLayer):
         Returns: 
             The output size of the layer.
         """
-        return len(self._output)
-
-    def output(self) -> Matrix1d:
-        """Get the output of the layer.
-        
-        Returns: 
-            Matrix holding the output of the layer.
-        """
-        return self._output
-
-    def input_gradients(self) -> Matrix1d:
-        """Get the input gradients of the layer.
-        
-        Returns: 
-            Matrix holding the input gradients of the layer.
-        """
-        return self._input_gradients
+        return self._output_size
 
     def feedforward(self, input_data: Matrix1d) -> bool:
         """Perform feedforward operation.
@@ -75,13 +72,13 @@ class Dense(IDenseLayer):
             True on success, false on failure.
         """
         op = "feedforward in dense layer"
-        if not utils.match_dimensions(self.input_size(), len(input_data), op):
+        if not utils.match_dimensions(self._input_size, len(input_data), op):
             return False
-        for i in range(self.output_size()):
-            val = self._bias[i]
-            for j in range(self.input_size()):
-                val += self._weights[i][j] * input_data[j]
-            self._output[i] = self._act_func.output(val)
+        # Compute the weighted sums (including the bias) of all nodes with a single
+        # matrix-vector product, then apply the activation function to all of them at once.
+        self._input_extended[:self._input_size] = input_data
+        np.matmul(self._params, self._input_extended, out=self._output)
+        self._act_func.output(self._output, out=self._output)
         return True
 
     def backpropagate(self, output_gradients: Matrix1d) -> bool:
@@ -94,15 +91,12 @@ class Dense(IDenseLayer):
             True on success, false on failure.
         """
         op = "backpropagation in dense layer"
-        if not utils.match_dimensions(self.output_size(), len(output_gradients), op):
+        if not utils.match_dimensions(self._output_size, len(output_gradients), op):
             return False
-        for i in range(self.output_size()):
-            error = output_gradients[i] - self._output[i]
-            self._error[i] = error * self._act_func.delta(self._output[i])
-        utils.init_matrix2d(self._input_gradients)
-        for i in range(self.input_size()):
-            for j in range(self.output_size()):
-                self._input_gradients[i] = self._error[j] * self._weights[j][i]
+        np.subtract(output_gradients, self._output, out=self._error)
+        self._error *= self._act_func.delta(self._output)
+        # Each input gradient is the sum of the errors weighted by the input's weights.
+        np.matmul(self._error, self._weights, out=self._input_gradients)
         return True
 
     def optimize(self, input_data: Matrix1d, learning_rate: float) -> bool:
@@ -117,11 +111,12 @@ class Dense(IDenseLayer):
             True on success, false on failure.
         """
         op = "optimization in dense layer"
-        if (not utils.match_dimensions(self.input_size(), len(input_data), op)
+        if (not utils.match_dimensions(self._input_size, len(input_data), op)
             or not utils.check_learning_rate(learning_rate, op)):
             return False
-        for i in range(self.output_size()):
-            self._bias[i] += self._error[i] * learning_rate
-            for j in range(self.input_size()):
-                self._weights[i][j] += self._error[i] * learning_rate * input_data[i]
+        # Adjust the weights and the bias with the outer product of the scaled error and the
+        # extended input (a rank-1 update).
+        self._input_extended[:self._input_size] = input_data
+        np.outer(self._error * learning_rate, self._input_extended, out=self._gradients)
+        self._params += self._gradients
         return True
@@ -1,12 +1,13 @@
 """Dense layer stub."""
 from ml import utils
+from ml._layer_base import _LayerBase
 from ml.act_func.types import ActFuncType
 from ml.dense_layer.interface import IDenseLayer
 from ml.types import Matrix1d
 
 # pylint: disable=unused-argument, duplicate-code
 
-class DenseStub(IDenseLayer):
+class DenseStub(_LayerBase, IDenseLayer):
     """Dense layer stub."""
 
     def __init__(self, input_size: int, output_size: int,
@@ -21,38 +22,6 @@ class DenseStub(IDenseLayer):
         self._input_gradients = utils.create_matrix1d(input_size)
         self._output          = utils.create_matrix1d(output_size)
 
-    def input_size(self) -> int:
-        """Get the input size of the layer.
-        
-        Returns: 
-            The input size of the layer.
-        """
-        return len(self._input_gradients)
-
-    def output_size(self) -> int:
-        """Get the output size of the layer.
-        
-        Returns: 
-            The output size of the layer.
-        """
-        return len(self._output)
-
-    def output(self) -> Matrix1d:
-        """Get the output of the layer.
-        
-        Returns: 
-            Matrix holding the output of the layer.
-        """
-        return self._output
-
-    def input_gradients(self) -> Matrix1d:
-        """Get the input gradients of the layer.
-        
-        Returns: 
-            Matrix holding the input gradients of the layer.
-        """
-        return self._input_gradients
-
     def feedforward(self, input_data: Matrix1d) -> bool:
         """Perform feedforward operation.
         
@@ -2,14 +2,15 @@
 from ml.act_func import factory as act_func_factory
 from ml.act_func.types import ActFuncType
 from ml.act_func.interface import IActFunc
+from ml.conv_layer.conv import Conv
 from ml.conv_layer.interface import IConvLayer
-from ml.conv_layer.stub import ConvStub, MaxPoolStub
+from ml.conv_layer.max_pool import MaxPool
 from ml.dense_layer.interface import IDenseLayer
 from ml.dense_layer.dense import Dense
 from ml.factory.interface import IFactory
 from ml.factory.stub import FactoryStub
+from ml.flatten_layer.flatten import Flatten
 from ml.flatten_layer.interface import IFlatten
-from ml.flatten_layer.stub import FlattenStub
 
 class Factory(IFactory):
     """Machine learning factory."""
@@ -36,8 +37,7 @@ class Factory(IFactory):
         Returns:
             The new convolutional layer.
         """
-         # Todo: Replace ConvStub with Conv when implemented.
-        return ConvStub(input_size, kernel_size, act_func_type)
+        return Conv(input_size, kernel_size, act_func_type)
 
     def dense_layer(self, input_size: int, output_size: int,
                     act_func_type: ActFuncType) -> IDenseLayer:
@@ -62,8 +62,7 @@ class Factory(IFactory):
         Returns:
             The new flatten layer.
         """
-        # Todo: Replace FlattenStub with Flatten when implemented.
-        return FlattenStub(input_size)
+        return Flatten(input_size)
 
     def max_pool(self, input_size: int, pool_size: int) -> IConvLayer:
         """Create a max pooling layer.
@@ -75,8 +74,7 @@ class Factory(IFactory):
         Returns:
             The new max pooling layer.
         """
-        # Todo: Replace MaxPoolStub with MaxPool when implemented.
-        return MaxPoolStub(input_size, pool_size)
+        return MaxPool(input_size, pool_size)
 
 def create(stub: bool = False) -> IFactory:
     """Create a factory.
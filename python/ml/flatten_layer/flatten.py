@@ -1,6 +1,51 @@
 """Flatten layer implementation."""
+import numpy as np
 
-# Todo: Implement the ml.flatten_layer.Flatten class here.
+from ml import utils
+from ml._layer_base import _LayerBase
+from ml.flatten_layer.interface import IFlatten
+from ml.types import Matrix1d, Matrix2d
 
-# When you have implemented this class, update the factory (ml/factory/factory.py)
-# to use it instead of the stub.
+class Flatten(_LayerBase, IFlatten):
+    """Flatten layer implementation."""
+
+    def __init__(self, input_size: int) -> None:
+        # Check the input size, throw an exception if invalid.
+        if input_size == 0:
+            raise ValueError("Input size cannot be 0!")
+        self._input_gradients = utils.create_matrix2d(input_size)
+        self._output          = utils.create_matrix1d(input_size * input_size)
+
+    def feedforward(self, input_data: Matrix2d) -> bool:
+        """Flatten the input from 2D to 1D.
+
+        Args:
+            input_data: Matrix holding input data.
+
+        Returns:
+            True on success, false on failure.
+        """
+        op = "feedforward in flatten layer"
+        if not (utils.match_dimensions(self.input_size(), len(input_data), op)
+                and utils.is_matrix2d_square(input_data, op)):
+            return False
+        # A contiguous input is flattened into a view of it (no elements are copied).
+        self._output = np.reshape(input_data, -1)
+        return True
+
+    def backpropagate(self, output_gradients: Matrix1d) -> bool:
+        """Unflatten the output gradients from 1D to 2D.
+
+        Args:
+            output_gradients: Matrix holding output gradients.
+
+        Returns:
+            True on success, false on failure.
+        """
+        op = "backpropagation in flatten layer"
+        if not utils.match_dimensions(self.output_size(), len(output_gradients), op):
+            return False
+        # Contiguous output gradients are unflattened into a view (no elements are copied).
+        self._input_gradients = np.reshape(output_gradients,
+                                           (self.input_size(), self.input_size()))
+        return True
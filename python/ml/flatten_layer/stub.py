@@ -1,9 +1,12 @@
 """Flatten layer stub."""
 from ml import utils
+from ml._layer_base import _LayerBase
 from ml.flatten_layer.interface import IFlatten
 from ml.types import Matrix1d, Matrix2d
 
-class FlattenStub(IFlatten):
+# pylint: disable=duplicate-code
+
+class FlattenStub(_LayerBase, IFlatten):
     """Flatten layer stub."""
 
     def __init__(self, input_size: int) -> None:
@@ -13,38 +16,6 @@ class FlattenStub(IFlatten):
         self._input_gradients = utils.create_matrix2d(input_size)
         self._output          = utils.create_matrix1d(input_size * input_size)
 
-    def input_size(self) -> int:
-        """Get the input size of the layer.
-        
-        Returns: 
-            The input size of the layer.
-        """
-        return len(self._input_gradients)
-
-    def output_size(self) -> int:
-        """Get the output size of the layer.
-        
-        Returns: 
-            The output size of the layer.
-        """
-        return len(self._output)
-
-    def output(self) -> Matrix1d:
-        """Get the output of the layer.
-        
-        Returns: 
-            Matrix holding the output of the layer.
-        """
-        return self._output
-
-    def input_gradients(self) -> Matrix2d:
-        """Get the input gradients of the layer.
-        
-        Returns: 
-            Matrix holding the input gradients of the layer.
-        """
-        return self._input_gradients
-
     def feedforward(self, input_data: Matrix2d) -> bool:
         """Flatten the input from 2D to 1D.
         
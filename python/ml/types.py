@@ -1,10 +1,14 @@
 """Machine learning types."""
+import numpy as np
+
+# Element type of all matrices (single precision floating point).
+DTYPE = np.float32
 
 # One-dimensional matrix.
-Matrix1d = list[float]
+Matrix1d = np.ndarray
 
 # Two-dimensional matrix.
-Matrix2d = list[Matrix1d]
+Matrix2d = np.ndarray
 
 # Three-dimensional matrix.
-Matrix3d = list[Matrix2d]
+Matrix3d = np.ndarray
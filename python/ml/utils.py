@@ -1,8 +1,9 @@
 """Machine learning utility functions."""
 from enum import Enum
-from ml.types import Matrix1d, Matrix2d
 
-# pylint: disable=consider-using-enumerate
+import numpy as np
+
+from ml.types import DTYPE, Matrix1d, Matrix2d
 
 class LearningRate(Enum):
     """Enumeration of learning rate limits."""
@@ -19,7 +20,7 @@ def create_matrix1d(size: int = 0) -> Matrix1d:
     Returns:
         The new matrix.
     """
-    return [0.0] * size
+    return np.zeros(size, dtype=DTYPE)
 
 
 def create_matrix2d(row_count: int = 0, col_count: int | None = None) -> Matrix2d:
@@ -38,7 +39,9 @@ def create_matrix2d(row_count: int = 0, col_count: int | None = None) -> Matrix2
     cols = col_count if col_count is not None else row_count
     if cols < 0:
         raise ValueError("Column count cannot be negative!")
-    return [[0.0] * cols for _ in range(rows)]
+    # Store the matrix row by row in a single contiguous buffer (C order), so that it can be
+    # reshaped or flattened into a view without copying.
+    return np.zeros((rows, cols), dtype=DTYPE, order="C")
 
 
 def init_matrix1d(matrix: Matrix1d) -> None:
@@ -47,8 +50,7 @@ def init_matrix1d(matrix: Matrix1d) -> None:
     Args: 
         matrix: The matrix to initialize.
     """
-    for i in range(len(matrix)):
-        matrix[i] = 0.0
+    matrix.fill(0.0)
 
 
 def init_matrix2d(matrix: Matrix2d) -> None:
@@ -57,9 +59,7 @@ def init_matrix2d(matrix: Matrix2d) -> None:
     Args: 
         matrix: The matrix to initialize.
     """
-    for row in range(len(matrix)):
-        for col in range(row):
-            matrix[row][col] = 0.0
+    matrix.fill(0.0)
 
 
 def is_matrix2d_square(matrix: Matrix2d, op_name: str | None = None) -> bool:
@@ -71,14 +71,19 @@ def is_matrix2d_square(matrix: Matrix2d, op_name: str | None = None) -> bool:
     Returns:
         True if given matrix is square, false otherwise.
     """
-    for row in matrix:
-        if len(row) != len(matrix):
-            if op_name is not None:
-                print(f"Cannot perform {op_name} due to matrix not being square!")
-            else:
-                print("Matrix is not square!")
-            return False
-    return True
+    # The rows of an array have the same length, hence comparing the shape is sufficient.
+    # Nested lists may be ragged, so the length of each row is checked instead.
+    if isinstance(matrix, np.ndarray):
+        square = matrix.ndim == 2 and matrix.shape[0] == matrix.shape[1]
+    else:
+        square = all(len(row) == len(matrix) for row in matrix)
+    if square:
+        return True
+    if op_name is not None:
+        print(f"Cannot perform {op_name} due to matrix not being square!")
+    else:
+        print("Matrix is not square!")
+    return False
 
 
 def match_dimensions(expected_size: int, actual_size: int, op_name: str | None = None) -> bool:
@@ -96,7 +101,7 @@ def match_dimensions(expected_size: int, actual_size: int, op_name: str | None =
         return True
     if op_name is not None:
         print(f"Cannot perform {op_name} due to dimension mismatch: "
-            " expected {expected_size}, actual is {actual_size}!")
+            f"expected {expected_size}, actual is {actual_size}!")
     else:
         print(f"Dimension mismatch: expected {expected_size}, actual is {actual_size}!")
     return False